@@ -5,24 +5,109 @@ Created on Thu Apr 25 13:37:09 2024
 
 @author: chrishornung
 """
+import os
+import threading
+import json
+import hashlib
+import requests
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import timedelta
 import dash
 from dash import dcc, html, Input, Output
+from dash.exceptions import PreventUpdate
 import plotly.express as px
+from flask_caching import Cache
+
+# Directory for cached downloads of the input files
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dutyhours')
+
+# Bumped whenever the layout of the cached snapshots changes
+CACHE_VERSION = 2
 
 # Function to read data from Google Sheets or CSV URL
 def read_data(url):
     if url.endswith('xlsx'):
-        xls = pd.ExcelFile(url)
-        data_dict = {}
+        # Cached files are keyed by a hash of the URL
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        xlsx_path = os.path.join(CACHE_DIR, key + '.xlsx')
+        parquet_path = os.path.join(CACHE_DIR, key + '.parquet')
+        meta_path = os.path.join(CACHE_DIR, key + '.json')
+
+        # Send the validators from the last download so an unchanged sheet comes back as 304
+        meta = {}
+        if os.path.exists(meta_path) and os.path.exists(parquet_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('version') != CACHE_VERSION:
+                meta = {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        response = requests.get(url, headers=headers, timeout=60)
+
+        # Sheet has not changed, load the parsed snapshot instead of the xlsx
+        if response.status_code == 304:
+            return pd.read_parquet(parquet_path)
+        response.raise_for_status()
+
+        # Files are written under a temporary name and then moved into place,
+        # so other workers sharing the cache never see a partly written file
+        tmp_suffix = '.%d.tmp' % os.getpid()
+        with open(xlsx_path + tmp_suffix, 'wb') as f:
+            f.write(response.content)
+        os.replace(xlsx_path + tmp_suffix, xlsx_path)
+
+        # Parse every sheet once and snapshot the combined result
+        xls = pd.ExcelFile(xlsx_path, engine='calamine')
+        sheets = []
         for sheet_name in xls.sheet_names:
-            df = pd.read_excel(xls, sheet_name, header=None)
-            df.columns = ['DateandTime', 'ArrivedLeft', 'Address', 'Location']
-            data_dict[sheet_name] = df
-        return data_dict
+            df = pd.read_excel(xls, sheet_name, header=None, usecols=[0, 1, 2, 3],
+                               names=['DateandTime', 'ArrivedLeft', 'Address', 'Location'],
+                               dtype={'DateandTime': 'string', 'ArrivedLeft': 'category',
+                                      'Address': 'string', 'Location': 'category'})
+            sheets.append(df)
+        data = pd.concat(sheets, ignore_index=True, copy=False)
+
+        # Convert 'DateandTime' column to datetime, the snapshot keeps the parsed values
+        data['DateandTime'] = pd.to_datetime(data['DateandTime'], format='%B %d, %Y at %I:%M%p')
+        data.to_parquet(parquet_path + tmp_suffix, engine='pyarrow', index=False)
+        os.replace(parquet_path + tmp_suffix, parquet_path)
+
+        with open(meta_path + tmp_suffix, 'w') as f:
+            json.dump({'version': CACHE_VERSION,
+                       'etag': response.headers.get('ETag'),
+                       'last_modified': response.headers.get('Last-Modified')}, f)
+        os.replace(meta_path + tmp_suffix, meta_path)
+        return data
     return None
 
+# Function to pair each 'Left location' event with the previous event at the same location,
+# expects the rows sorted by location and time
+def pair_arrive_left(data):
+    times = data['DateandTime'].to_numpy()
+    location_codes = data['Location'].cat.codes.to_numpy()
+
+    # Hours since the previous row, in one pass over the rows sorted by location
+    elapsed = np.full(len(data), np.nan)
+    elapsed[1:] = (times[1:] - times[:-1]) / np.timedelta64(1, 'h')
+
+    # Rows that start a new location, or have no location, have no previous event
+    starts = np.ones(len(data), dtype=bool)
+    starts[1:] = (location_codes[1:] != location_codes[:-1]) | (location_codes[1:] < 0)
+    elapsed[starts] = np.nan
+
+    # Keep the departures that have a previous event to pair with
+    keep = ~np.isnan(elapsed) & (data['ArrivedLeft'] != 'Arrived at location').to_numpy()
+    # Hours are stored as float32, the running totals used for the graphs are summed in float64
+    return data[keep].assign(TimeElapsed=elapsed[keep].astype('float32'))
+
 # URLs of input files, separate them by commas
 urls = [
     #SNGH/CHKD
@@ -31,65 +116,122 @@ urls = [
     "https://docs.google.com/spreadsheets/d/e/2PACX-1vS83REQuNZP0bIeYtG2IsRO3258pTYbOSB-54xxGzuzG05JtuIogdYpsXdpwtu8dP-K-GKqDj6f0ww-/pub?output=xlsx"
 ]
 
-# List to store dataframes
-dfs = []
+# Function to read, combine and pair the data from all URLs and precompute the running totals,
+# cached so the work happens once per process
+@lru_cache(maxsize=1)
+def ingest():
+    # List to store dataframes
+    dfs = []
+
+    # Read data from all URLs concurrently, the work is mostly waiting on the network
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        results = list(executor.map(read_data, urls))
+
+    for data in results:
+        if isinstance(data, dict):
+            for df in data.values():
+                dfs.append(df)
+        elif isinstance(data, pd.DataFrame):
+            dfs.append(data)
 
-# Read data from each URL
-for url in urls:
-    data = read_data(url)
-    if isinstance(data, dict):
-        for df in data.values():
-            dfs.append(df)
-    elif isinstance(data, pd.DataFrame):
-        dfs.append(data)
+    # Combine data from all URLs
+    data = pd.concat(dfs, ignore_index=True, copy=False)
 
-# Combine data from all URLs
-combined_df = pd.concat(dfs, ignore_index=True)
+    # Store the repeated strings as categories so comparisons and grouping work on integer codes
+    for column in ('ArrivedLeft', 'Address', 'Location'):
+        data[column] = data[column].astype('category')
 
-# Keep only necessary columns
-combined_df = combined_df[['DateandTime', 'ArrivedLeft', 'Address', 'Location']]
+    # Write combined dataframe to CSV when debugging
+    if os.environ.get('DUTYHOURS_DEBUG'):
+        data.to_csv('combined_data.csv', index=False)
 
-# Write combined dataframe to CSV
-combined_df.to_csv('combined_data.csv', index=False)
+    # Sort the dataframe by 'Location' and 'DateandTime' using their integer values,
+    # rows missing either one go last within their group as with sort_values
+    location_keys = data['Location'].cat.codes.to_numpy().astype('int64')
+    location_keys[location_keys < 0] = len(data['Location'].cat.categories)
+    time_keys = data['DateandTime'].to_numpy().view('i8').copy()
+    time_keys[data['DateandTime'].isna().to_numpy()] = np.iinfo(np.int64).max
+    order = np.lexsort((time_keys, location_keys))
 
-# Read the CSV file
-data = pd.read_csv("combined_data.csv")
+    # Remove duplicates from 'DateandTime' column, keeping the first in sorted order,
+    # by hashing the int64 times so the frame is only reindexed once
+    order = order[~pd.Series(time_keys[order]).duplicated(keep='first').to_numpy()]
+    data = data.iloc[order]
 
-# Convert 'DateandTime' column to datetime
-data['DateandTime'] = pd.to_datetime(data['DateandTime'], format='%B %d, %Y at %I:%M%p')
+    # Calculate time elapsed in hours for each departure
+    data = pair_arrive_left(data)
 
-# Sort the dataframe by 'DateandTime' and 'Location'
-data = data.sort_values(by=['Location', 'DateandTime'])
+    # Save the output to a Parquet file when debugging, it keeps the datetime and category dtypes
+    if os.environ.get('DUTYHOURS_DEBUG'):
+        data.to_parquet("combined_datawtimes.parquet", engine='pyarrow', compression='zstd', index=False)
 
-# Remove duplicates from 'DateandTime' column
-data.drop_duplicates(subset=['DateandTime'], keep='first', inplace=True)
+    df = data
 
-# Calculate time elapsed in hours for each row
-data['TimeElapsed'] = data.groupby('Location')['DateandTime'].diff().dt.total_seconds() / 3600
+    # Fingerprint of the loaded data, part of the figure cache key so figures built from other data are not reused
+    # and every worker that loaded the same data shares the same cached figures
+    data_version = format(pd.util.hash_pandas_object(df).sum(), 'x')
 
-# Remove rows with NaN in 'TimeElapsed' column
-data = data.dropna(subset=['TimeElapsed'])
+    # Get the min and max dates from the dataset
+    min_date = (df['DateandTime'].max() + timedelta(days=-30)).strftime('%Y-%m-%d')
+    max_date = (df['DateandTime'].max() + timedelta(days=1)).strftime('%Y-%m-%d')
 
-# Remove rows where 'ArrivedLeft' is 'Arrived at location'
-data = data[data['ArrivedLeft'] != 'Arrived at location']
+    # Order the data by time so any date range is a contiguous block of rows
+    df = df.sort_values('DateandTime', kind='stable')
+    event_times = df['DateandTime'].to_numpy()
+    event_hours = df['TimeElapsed'].to_numpy()
 
-# Save the output to a new CSV file
-data.to_csv("combined_datawtimes.csv", index=False)
+    # Running total of duty hours, the hours in rows i0:i1 are cumulative_hours[i1] - cumulative_hours[i0]
+    cumulative_hours = np.concatenate([[0.0], np.cumsum(event_hours, dtype=np.float64)])
 
-# Load the data
-df = pd.read_csv("combined_datawtimes.csv")
+    # Rows where each day starts, plus the end of the last day
+    event_days = event_times.astype('datetime64[D]')
+    day_starts = np.flatnonzero(np.concatenate([[True], event_days[1:] != event_days[:-1]]))
+    day_bounds = np.append(day_starts, len(df))
+    day_dates = pd.DatetimeIndex(event_days[day_starts]).date
 
-# Convert DateandTime to datetime format
-df['DateandTime'] = pd.to_datetime(df['DateandTime'])
+    # Monday-based week of each day, counted in whole weeks from the epoch (1970-01-01 was a Thursday)
+    day_weeks = (event_days[day_starts].astype('int64') + 3) // 7
 
-# Get the min and max dates from the dataset
-min_date = (df['DateandTime'].max() + timedelta(days=-30)).strftime('%Y-%m-%d')
-max_date = (df['DateandTime'].max() + timedelta(days=1)).strftime('%Y-%m-%d')
+    # Rows of each location in time order and a running total of duty hours over them,
+    # searching a location's rows for i0 and i1 gives its hours in rows i0:i1
+    location_codes, location_labels = pd.factorize(df['Location'], sort=True)
+    location_order = np.argsort(location_codes, kind='stable')
+    location_splits = np.cumsum(np.bincount(location_codes, minlength=len(location_labels)))[:-1]
+    location_rows = np.split(location_order, location_splits)
+    cumulative_location_hours = [np.concatenate([[0.0], np.cumsum(event_hours[rows], dtype=np.float64)]) for rows in location_rows]
 
+    return {
+        'df': df,
+        'data_version': data_version,
+        'min_date': min_date,
+        'max_date': max_date,
+        'event_times': event_times,
+        'cumulative_hours': cumulative_hours,
+        'day_bounds': day_bounds,
+        'day_dates': day_dates,
+        'day_weeks': day_weeks,
+        'location_labels': location_labels,
+        'location_rows': location_rows,
+        'cumulative_location_hours': cumulative_location_hours,
+    }
+
+# Lock so a request arriving while the background load runs waits for it instead of loading again
+load_lock = threading.Lock()
+
+# Function to get the loaded data, the first call does the ingest
+def load_df():
+    with load_lock:
+        return ingest()
+
+# Start loading in the background so the server can accept requests right away
+threading.Thread(target=load_df, daemon=True).start()
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
 
+# Cache for the figures of each selected date range
+cache = Cache(app.server, config={'CACHE_TYPE': 'FileSystemCache', 'CACHE_DIR': '/tmp/dutyhours-cache'})
+
 # Custom colors
 colors = {
     'background': '#f9f9f9',
@@ -97,68 +239,83 @@ colors = {
     'accent': '#007bff'
 }
 
-# Define the layout of the dashboard
-app.layout = html.Div(style={'backgroundColor': colors['background'], 'fontFamily': 'Arial, sans-serif'}, children=[
-    # Header
-    html.H1(children='Duty Hours Dashboard', style={'textAlign': 'center', 'color': colors['accent'], 'marginTop': '40px'}),
+# Function to build the layout of the dashboard with the given default date range
+def build_layout(start_date=None, end_date=None):
+    return html.Div(style={'backgroundColor': colors['background'], 'fontFamily': 'Arial, sans-serif'}, children=[
+        # Header
+        html.H1(children='Duty Hours Dashboard', style={'textAlign': 'center', 'color': colors['accent'], 'marginTop': '40px'}),
     
-    # Input boxes for start and end date
-    html.Div([
-        html.Label('Select Date Range', style={'color': colors['text'], 'marginRight': '10px'}),
-        dcc.DatePickerRange(
-            id='date-range-picker',
-            start_date=min_date,
-            end_date=max_date,
-            display_format='YYYY-MM-DD',
-            style={'marginRight': '20px'}
-        ),
-    ], style={'marginBottom': '30px', 'marginTop': '20px', 'textAlign': 'center'}),
+        # Input boxes for start and end date
+        html.Div([
+            html.Label('Select Date Range', style={'color': colors['text'], 'marginRight': '10px'}),
+            dcc.DatePickerRange(
+                id='date-range-picker',
+                start_date=start_date,
+                end_date=end_date,
+                display_format='YYYY-MM-DD',
+                style={'marginRight': '20px'}
+            ),
+        ], style={'marginBottom': '30px', 'marginTop': '20px', 'textAlign': 'center'}),
     
-    # Graph 1: Duty Hours per Specified Time Period
-    html.Div([
-        dcc.Graph(id='graph1', style={'height': '400px'}),
-    ], style={'marginBottom': '40px', 'textAlign': 'center'}),
+        # Graph 1: Duty Hours per Specified Time Period
+        html.Div([
+            dcc.Graph(id='graph1', style={'height': '400px'}),
+        ], style={'marginBottom': '40px', 'textAlign': 'center'}),
     
-    # Graph 2: Duty Hours per Specified Time Period by Day
-    html.Div([
-        dcc.Graph(id='graph2', style={'height': '400px'}),
-    ], style={'marginBottom': '40px', 'textAlign': 'center'}),
-
-    # Graph 3: Duty Hours per Specified Time Period by Week
-    html.Div([
-        dcc.Graph(id='graph4', style={'height': '400px'}),
-    ], style={'marginBottom': '40px', 'textAlign': 'center'}),
+        # Graph 2: Duty Hours per Specified Time Period by Day
+        html.Div([
+            dcc.Graph(id='graph2', style={'height': '400px'}),
+        ], style={'marginBottom': '40px', 'textAlign': 'center'}),
+
+        # Graph 3: Duty Hours per Specified Time Period by Week
+        html.Div([
+            dcc.Graph(id='graph4', style={'height': '400px'}),
+        ], style={'marginBottom': '40px', 'textAlign': 'center'}),
     
-    # Graph 4: Duty Hours per Specified Time Period by Location
-    html.Div([
-        dcc.Graph(id='graph3', style={'height': '400px'}),
-    ], style={'marginBottom': '40px', 'textAlign': 'center'}),
-])
+        # Graph 4: Duty Hours per Specified Time Period by Location
+        html.Div([
+            dcc.Graph(id='graph3', style={'height': '400px'}),
+        ], style={'marginBottom': '40px', 'textAlign': 'center'}),
+    ])
 
-# Callback to update all graphs
-@app.callback(
-    [Output('graph1', 'figure'),
-     Output('graph2', 'figure'),
-     Output('graph3', 'figure'),
-     Output('graph4', 'figure')],
-    [Input('date-range-picker', 'start_date'),
-     Input('date-range-picker', 'end_date')]
-)
-def update_graphs(start_date, end_date):
-    # Filter data based on selected date range
-    filtered_df = df[(df['DateandTime'] >= start_date) & (df['DateandTime'] <= end_date)]
+# Layout served on each page load, so the default date range follows the loaded data
+def serve_layout():
+    loaded = load_df()
+    return build_layout(loaded['min_date'], loaded['max_date'])
+
+# Dash validates callbacks against this static copy instead of calling serve_layout at import,
+# which would wait for the background load
+app.validation_layout = build_layout()
+app.layout = serve_layout
+
+# Function to find the block of rows in the selected date range
+def find_rows(loaded, start_date, end_date):
+    # Keep the current graphs while either end of the range is cleared
+    if start_date is None or end_date is None:
+        raise PreventUpdate
+    event_times = loaded['event_times']
+    i0 = np.searchsorted(event_times, pd.Timestamp(start_date).to_datetime64(), side='left')
+    i1 = np.searchsorted(event_times, pd.Timestamp(end_date).to_datetime64(), side='right')
+    # An end before the start selects no rows
+    return i0, max(i1, i0)
+
+# Function to total the duty hours in rows i0:i1 for each day that overlaps them,
+# returns the range of days and their totals
+def hours_by_day(loaded, i0, i1):
+    day_bounds, cumulative_hours = loaded['day_bounds'], loaded['cumulative_hours']
+    d0 = np.searchsorted(day_bounds, i0, side='right') - 1
+    d1 = np.searchsorted(day_bounds, i1, side='left')
+    bounds = np.clip(day_bounds[d0:d1 + 1], i0, i1)
+    return d0, d1, cumulative_hours[bounds[1:]] - cumulative_hours[bounds[:-1]]
+
+# Functions to build each figure for a date range, memoized per range and data version
+@cache.memoize(timeout=3600)
+def build_total_figure(start_date, end_date, data_version):
+    loaded = load_df()
+    i0, i1 = find_rows(loaded, start_date, end_date)
     
     # Calculate total duty hours
-    total_duty_hours = filtered_df['TimeElapsed'].sum()
-    
-    # Group by day and calculate total duty hours
-    duty_hours_by_day = filtered_df.groupby(filtered_df['DateandTime'].dt.date)['TimeElapsed'].sum()
-    
-    # Group by location and calculate total duty hours
-    duty_hours_by_location = filtered_df.groupby('Location')['TimeElapsed'].sum()
-    
-    # Group by week and calculate total duty hours
-    duty_hours_by_week = filtered_df.groupby(filtered_df['DateandTime'].dt.strftime('%W'))['TimeElapsed'].sum()
+    total_duty_hours = loaded['cumulative_hours'][i1] - loaded['cumulative_hours'][i0]
     
     # Create bar chart for duty hours per specified time period
     fig1 = px.bar(x=['Total Duty Hours'], y=[total_duty_hours], text=[round(total_duty_hours)],
@@ -167,6 +324,16 @@ def update_graphs(start_date, end_date):
                  color_discrete_sequence=[colors['accent']])
     fig1.update_traces(texttemplate='%{text}', textposition='inside')  # Change text position to inside
     fig1.update_layout(plot_bgcolor=colors['background'], paper_bgcolor=colors['background'], font_color=colors['text'])
+    return fig1.to_dict()
+
+@cache.memoize(timeout=3600)
+def build_day_figure(start_date, end_date, data_version):
+    loaded = load_df()
+    i0, i1 = find_rows(loaded, start_date, end_date)
+    
+    # Total duty hours for each day that overlaps the range
+    d0, d1, day_hours = hours_by_day(loaded, i0, i1)
+    duty_hours_by_day = pd.Series(day_hours, index=loaded['day_dates'][d0:d1])
     
     # Create bar chart for duty hours per specified time period by day
     fig2 = px.bar(x=duty_hours_by_day.index, y=duty_hours_by_day.values, text=duty_hours_by_day.values.round(),
@@ -175,6 +342,21 @@ def update_graphs(start_date, end_date):
                  color_discrete_sequence=[colors['accent']])
     fig2.update_traces(texttemplate='%{text}', textposition='inside')  # Change text position to inside
     fig2.update_layout(plot_bgcolor=colors['background'], paper_bgcolor=colors['background'], font_color=colors['text'])
+    return fig2.to_dict()
+
+@cache.memoize(timeout=3600)
+def build_location_figure(start_date, end_date, data_version):
+    loaded = load_df()
+    i0, i1 = find_rows(loaded, start_date, end_date)
+    
+    # Total duty hours for each location with rows in the range
+    location_hours = np.zeros(len(loaded['location_labels']))
+    present = np.zeros(len(loaded['location_labels']), dtype=bool)
+    for code, (rows, cumulative) in enumerate(zip(loaded['location_rows'], loaded['cumulative_location_hours'])):
+        k0, k1 = np.searchsorted(rows, [i0, i1])
+        location_hours[code] = cumulative[k1] - cumulative[k0]
+        present[code] = k1 > k0
+    duty_hours_by_location = pd.Series(location_hours[present], index=loaded['location_labels'][present])
     
     # Create bar chart for duty hours per specified time period by location
     fig3 = px.bar(x=duty_hours_by_location.index, y=duty_hours_by_location.values, text=duty_hours_by_location.values.round(),
@@ -183,16 +365,59 @@ def update_graphs(start_date, end_date):
                  color_discrete_sequence=[colors['accent']])
     fig3.update_traces(texttemplate='%{text}', textposition='inside')  # Change text position to inside
     fig3.update_layout(plot_bgcolor=colors['background'], paper_bgcolor=colors['background'], font_color=colors['text'])
+    return fig3.to_dict()
+
+@cache.memoize(timeout=3600)
+def build_week_figure(start_date, end_date, data_version):
+    loaded = load_df()
+    i0, i1 = find_rows(loaded, start_date, end_date)
+    
+    # Group the daily totals by week and label each week with its Monday
+    d0, d1, day_hours = hours_by_day(loaded, i0, i1)
+    duty_hours_by_week = pd.Series(day_hours).groupby(loaded['day_weeks'][d0:d1]).sum()
+    duty_hours_by_week.index = pd.DatetimeIndex((duty_hours_by_week.index.to_numpy() * 7 - 3).astype('datetime64[D]')).strftime('%Y-%m-%d')
     
     # Create bar chart for duty hours per specified time period by week
     fig4 = px.bar(x=duty_hours_by_week.index, y=duty_hours_by_week.values, text=duty_hours_by_week.values.round(),
-                 labels={'x': 'Week', 'y': 'Duty Hours'},
+                 labels={'x': 'Week Starting', 'y': 'Duty Hours'},
                  title='Duty Hours per Specified Time Period by Week (Monday to Sunday)',
                  color_discrete_sequence=[colors['accent']])
     fig4.update_traces(texttemplate='%{text}', textposition='inside')  # Change text position to inside
     fig4.update_layout(plot_bgcolor=colors['background'], paper_bgcolor=colors['background'], font_color=colors['text'])
-    
-    return fig1, fig2, fig3, fig4
+    return fig4.to_dict()
+
+# Callbacks to update each graph, Dash accepts the cached figure dicts as they are
+@app.callback(
+    Output('graph1', 'figure'),
+    [Input('date-range-picker', 'start_date'),
+     Input('date-range-picker', 'end_date')]
+)
+def update_graph1(start_date, end_date):
+    return build_total_figure(start_date, end_date, load_df()['data_version'])
+
+@app.callback(
+    Output('graph2', 'figure'),
+    [Input('date-range-picker', 'start_date'),
+     Input('date-range-picker', 'end_date')]
+)
+def update_graph2(start_date, end_date):
+    return build_day_figure(start_date, end_date, load_df()['data_version'])
+
+@app.callback(
+    Output('graph3', 'figure'),
+    [Input('date-range-picker', 'start_date'),
+     Input('date-range-picker', 'end_date')]
+)
+def update_graph3(start_date, end_date):
+    return build_location_figure(start_date, end_date, load_df()['data_version'])
+
+@app.callback(
+    Output('graph4', 'figure'),
+    [Input('date-range-picker', 'start_date'),
+     Input('date-range-picker', 'end_date')]
+)
+def update_graph4(start_date, end_date):
+    return build_week_figure(start_date, end_date, load_df()['data_version'])
 
 # Run the app
 # This is for Gunicorn compatibility
@@ -0,0 +1,55 @@
+import importlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StartupTest(unittest.TestCase):
+    def test_import_does_not_wait_for_ingest(self):
+        # Downloads block until the test releases them, so the import can only
+        # return if nothing at import time waits on ingest()
+        release = threading.Event()
+
+        def blocked_get(*args, **kwargs):
+            release.wait(30)
+            raise requests.ConnectionError('download blocked by test')
+
+        thread_errors = []
+        threads_before = set(threading.enumerate())
+        sys.modules.pop('app', None)
+        with tempfile.TemporaryDirectory() as home, \
+                mock.patch.dict(os.environ, {'HOME': home}), \
+                mock.patch('requests.get', side_effect=blocked_get), \
+                mock.patch('threading.excepthook', thread_errors.append):
+            try:
+                start = time.monotonic()
+                with warnings.catch_warnings():
+                    # plotly 5.9 still uses np.bool8, which numpy deprecates
+                    warnings.filterwarnings('ignore', category=DeprecationWarning, module='plotly')
+                    app = importlib.import_module('app')
+                elapsed = time.monotonic() - start
+                self.assertEqual(app.ingest.cache_info().currsize, 0)
+                self.assertLess(elapsed, 30)
+                self.assertTrue(app.CACHE_DIR.startswith(home))
+            finally:
+                # Let the background load fail and wait for it before the patches are undone
+                release.set()
+                for thread in set(threading.enumerate()) - threads_before:
+                    thread.join(30)
+                sys.modules.pop('app', None)
+
+        # The only error from the background load is the blocked download
+        self.assertEqual([type(error.exc_value) for error in thread_errors], [requests.ConnectionError])
+
+
+if __name__ == '__main__':
+    unittest.main()